@@ -1,9 +1,109 @@
-from requests import get
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from json import dumps
+try:
+    # orjson decodes the (large) API responses much faster
+    from orjson import loads
+except ImportError:
+    from json import loads
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from http import HTTPStatus
+from threading import Lock
+from urllib.parse import parse_qs, urlencode, urlparse
 from typing import Dict, Union, List
 
+StructureType = Dict[str, Union[dict, str]]
+
+
+def _encode_structure(structure):
+    """Return the compact JSON encoding of an API `structure` dict."""
+    return dumps(structure, separators=(",", ":"))
+
+
+# Structures (column name: API metric) requested by CovidData. Their JSON
+# encodings are built once, at import.
+_NATIONAL_STRUCTURE = {
+    "date": "date",
+    "name": "areaName",
+    "case_newCases": "newCasesByPublishDate",
+    "case_newCasesChange": "newCasesByPublishDateChange",
+    "case_newCasesPercChange": "newCasesByPublishDateChangePercentage",
+    "case_rate": "newCasesBySpecimenDateRollingRate",
+    "case_cumulativeCases": "cumCasesByPublishDate",
+    "death_dailyDeaths": "newDeaths28DaysByPublishDate",
+    "death_newDeathRate": "newDeaths28DaysByDeathDateRate",
+    "death_cumulativeDeaths": "cumDeaths28DaysByDeathDate",
+    "death_cumulativeDeathsRate": "cumDeaths28DaysByDeathDateRate",
+    "death_Demographics": "newDeaths28DaysByDeathDateAgeDemographics",
+    "vac_first_dose": "cumPeopleVaccinatedFirstDoseByVaccinationDate",
+    "vac_second_dose": "cumPeopleVaccinatedSecondDoseByPublishDate",
+    "vac_total_perc":
+    "cumVaccinationCompleteCoverageByVaccinationDatePercentage",
+    "vac_demographics": "vaccinationsAgeDemographics",
+    "hosp_hospitalCases": "hospitalCases",
+    "hosp_newAdmissions": "newAdmissions",
+    "hosp_newAdmissionsChange": "newAdmissionsChange",
+    "hosp_covidOccupiedMVBeds": "covidOccupiedMVBeds"
+}
+
+_REGIONAL_STRUCTURE = {
+    "date": "date",
+    "name": "areaName",
+    "cases_newDaily": "newCasesBySpecimenDate",
+    "cases_cumulative": "cumCasesBySpecimenDate",
+    "case_rate": "newCasesBySpecimenDateRollingRate",
+    "cases_demographics": "newCasesBySpecimenDateAgeDemographics",
+    "death_newDeathRate": "newDeaths28DaysByDeathDateRate",
+    "death_cumulativeDeaths": "cumDeaths28DaysByDeathDate",
+    "death_cumulativeDeathsRate": "cumDeaths28DaysByDeathDateRate",
+    "death_Demographics": "newDeaths28DaysByDeathDateAgeDemographics",
+    "vac_firstDose":
+    "cumVaccinationFirstDoseUptakeByVaccinationDatePercentage",
+    "vac_secondDose":
+    "cumVaccinationSecondDoseUptakeByVaccinationDatePercentage",
+    "vac_demographics": "vaccinationsAgeDemographics"
+}
+
+# Only the dates of the regional data, for picking a date to plot
+_REGIONAL_DATES_STRUCTURE = {
+    "date": "date"
+}
+
+_LOCAL_STRUCTURE = {
+    "date": "date",
+    "name": "areaName",
+    "case_newDaily": "newCasesByPublishDate",
+    "case_cumulative": "cumCasesBySpecimenDate",
+    "case_rate": "newCasesBySpecimenDateRollingRate"
+}
+
+# The UK columns the API publishes directly (areaType=overview), so they
+# need not be added up from the nations by get_uk_data. First doses by
+# vaccination date and the completed coverage percentage are only
+# published per nation.
+_OVERVIEW_STRUCTURE = {
+    "date": "date",
+    "case_newCases": "newCasesByPublishDate",
+    "case_cumulativeCases": "cumCasesByPublishDate",
+    "death_dailyDeaths": "newDeaths28DaysByPublishDate",
+    "death_cumulativeDeaths": "cumDeaths28DaysByDeathDate",
+    "hosp_hospitalCases": "hospitalCases",
+    "hosp_newAdmissions": "newAdmissions",
+    "hosp_covidOccupiedMVBeds": "covidOccupiedMVBeds",
+    "hosp_newAdmissionsChange": "newAdmissionsChange",
+    "vac_second_dose": "cumPeopleVaccinatedSecondDoseByPublishDate"
+}
+
+_NATIONAL_STRUCTURE_JSON = _encode_structure(_NATIONAL_STRUCTURE)
+_REGIONAL_STRUCTURE_JSON = _encode_structure(_REGIONAL_STRUCTURE)
+_REGIONAL_DATES_STRUCTURE_JSON = _encode_structure(_REGIONAL_DATES_STRUCTURE)
+_LOCAL_STRUCTURE_JSON = _encode_structure(_LOCAL_STRUCTURE)
+_OVERVIEW_STRUCTURE_JSON = _encode_structure(_OVERVIEW_STRUCTURE)
+
 
 class CovidData:
     """Class for fetching data from gov.uk API
@@ -17,8 +117,29 @@ class CovidData:
                 'North West', 'South East', 'South West', 'West Midlands',
                 'Yorkshire and The Humber']
     _ENDPOINT = "https://api.coronavirus.data.gov.uk/v1/data"
-
-    def __init__(self, nation='england'):
+    # Upper bound on the number of pages requested at the same time
+    _MAX_WORKERS = 8
+    # Columns returned by get_uk_data, besides the date and nation
+    _UK_COLUMNS = ['case_newCases', 'case_cumulativeCases',
+                   'death_dailyDeaths', 'death_cumulativeDeaths',
+                   'hosp_hospitalCases', 'hosp_newAdmissions',
+                   'hosp_covidOccupiedMVBeds', 'hosp_newAdmissionsChange',
+                   'vac_first_dose', 'vac_second_dose', 'vac_total_perc']
+    # Types of the numeric national columns. float64 rather than a nullable
+    # integer type so missing values are NaN, which matplotlib can plot.
+    _NATIONAL_DTYPES = dict.fromkeys(
+        ['case_newCases', 'case_newCasesChange', 'case_newCasesPercChange',
+         'case_rate', 'case_cumulativeCases', 'death_dailyDeaths',
+         'death_newDeathRate', 'death_cumulativeDeaths',
+         'death_cumulativeDeathsRate', 'vac_first_dose', 'vac_second_dose',
+         'vac_total_perc', 'hosp_hospitalCases', 'hosp_newAdmissions',
+         'hosp_newAdmissionsChange', 'hosp_covidOccupiedMVBeds'],
+        'float64')
+    # Session shared by every CovidData object, created on first use
+    _shared_session = None
+    _shared_session_lock = Lock()
+
+    def __init__(self, nation='england', cache_ttl=None):
         """
         Create a CovidData object. This will read data from the
         gov.uk covid data API.
@@ -27,6 +148,10 @@ class CovidData:
             - nation: This specifies for which nation to collect data.
               it is one of 'scotland', 'england', 'wales' or 'northern
               ireland'.
+            - cache_ttl: optional number of seconds for which API
+              responses are kept in an on-disk cache ('covidatx.sqlite'),
+              so repeated calls do not download the data again. Requires
+              the requests-cache package. By default nothing is cached.
 
         Returns:
             A `CovidData` object.
@@ -40,6 +165,48 @@ class CovidData:
                                 or wales or northern ireland')
         self.nation = nation.lower()
 
+        if cache_ttl is None:
+            self._session = self._get_shared_session()
+        else:
+            try:
+                from requests_cache import CachedSession
+            except ImportError:
+                raise ImportError('`cache_ttl` requires the requests-cache'
+                                  + ' package to be installed')
+            self._session = CachedSession(cache_name='covidatx',
+                                          backend='sqlite',
+                                          expire_after=cache_ttl)
+            self._configure_session(self._session)
+
+    @classmethod
+    def _configure_session(cls, session):
+        """Set up connection pooling and retries on `session`."""
+        # raise_on_status=False hands the last 5xx response back, so
+        # _fetch_page still reports it as a RuntimeError
+        retries = Retry(total=3, backoff_factor=0.3,
+                        status_forcelist=[500, 502, 503, 504],
+                        raise_on_status=False)
+        # Large enough for get_uk_data's four concurrent nation fetches
+        # plus its overview fetch, each paging up to _MAX_WORKERS at once
+        pool_size = cls._MAX_WORKERS * (len(cls._nations) + 1)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size,
+                              max_retries=retries)
+        session.mount("https://", adapter)
+        return session
+
+    @classmethod
+    def _get_shared_session(cls):
+        """Return the Session shared by every CovidData object.
+
+        The plotting functions create several CovidData objects per plot.
+        Sharing one Session means they all reuse the same pool of open
+        connections (and TLS sessions) to the API.
+        """
+        with cls._shared_session_lock:
+            if cls._shared_session is None:
+                cls._shared_session = cls._configure_session(Session())
+        return cls._shared_session
+
     @property
     def nation_list(self):
         """Return list of available nations"""
@@ -50,6 +217,161 @@ class CovidData:
         """Return list of available nations"""
         return self._regions
 
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _build_query(filters, structure_json):
+        """Build the URL-encoded query string for a request.
+
+        The result is cached, so the query is only encoded once per
+        process rather than on every call.
+
+        Parameters:
+                - filters: tuple of API filters.
+                - structure_json: the JSON-encoded structure.
+
+        Returns:
+                The query string shared by every page of the request.
+        """
+        return urlencode({
+            "filters": str.join(";", filters),
+            "structure": structure_json
+        })
+
+    def _fetch_page(self, query, page_number):
+        """Fetch a single page of results from the API.
+
+        Parameters:
+                - query: URL-encoded query string (filters and structure)
+                  shared by every page of the request.
+                - page_number: the page to retrieve.
+
+        Returns:
+                The decoded JSON response as a dict, or None if the page
+                has no content (i.e. we are past the last page).
+        """
+        params = f"{query}&page={page_number}"
+        response = self._session.get(self._ENDPOINT, params=params,
+                                     timeout=30)
+
+        if response.status_code >= HTTPStatus.BAD_REQUEST:
+            raise RuntimeError(f'Request failed: {response.text}')
+        elif response.status_code == HTTPStatus.NO_CONTENT:
+            return None
+
+        return loads(response.content)
+
+    def _fetch_columns(self, query, columns, page_number):
+        """Fetch a single page and split its records into columns.
+
+        This runs in the worker threads of _get_data, so turning the
+        records into columns overlaps with the download of other pages
+        instead of waiting for all of them to arrive.
+
+        Parameters:
+                - query: URL-encoded query string (filters and structure).
+                - columns: the keys of the request's structure.
+                - page_number: the page to retrieve.
+
+        Returns:
+                A (page_columns, pagination) tuple, where page_columns maps
+                each column to its list of values on the page and
+                pagination is the response's "pagination" dict, or None if
+                the page has no content.
+        """
+        current_data = self._fetch_page(query, page_number)
+        if current_data is None:
+            return None
+
+        page_data: List[StructureType] = current_data['data']
+        page_columns = {column: [record.get(column) for record in page_data]
+                        for column in columns}
+        return page_columns, current_data["pagination"]
+
+    @staticmethod
+    def _last_page(pagination):
+        """Return the number of the last page, read from the "last" link of
+        a response's pagination, or None if it is not given.
+        """
+        last = pagination.get("last")
+        if not last:
+            return None
+        page = parse_qs(urlparse(last).query).get("page")
+        return int(page[0]) if page else None
+
+    def _get_data(self, filters, structure, structure_json=None):
+        """Retrieve every page of data matching `filters` from the API.
+
+        The first page says (in its pagination) which page is the last,
+        so all of the remaining pages are then requested at the same
+        time. If the API does not say, pages are requested concurrently
+        in windows that double in size (2, 4, 8, ... up to `_MAX_WORKERS`
+        pages) until the last page is found.
+
+        Parameters:
+                - filters: list of API filters, e.g. ["areaType=nation"].
+                - structure: dict mapping column names to API metrics.
+                - structure_json: `structure` already encoded as JSON, if
+                  available (see the module-level *_STRUCTURE_JSON).
+
+        Returns:
+                A pandas DataFrame with one column per key of `structure`.
+        """
+        if structure_json is None:
+            structure_json = _encode_structure(structure)
+        query = self._build_query(tuple(filters), structure_json)
+        columns = list(structure)
+        fetch = partial(self._fetch_columns, query, columns)
+
+        # Build the frame column-wise: one list per structure key, extended
+        # with each page's values as it arrives.
+        data = {column: [] for column in columns}
+
+        def add_page(page_columns):
+            for column in columns:
+                data[column].extend(page_columns[column])
+
+        result = fetch(1)
+        # The "next" attribute in "pagination" will be `None`
+        # when we reach the end.
+        if result is not None:
+            page_columns, pagination = result
+            add_page(page_columns)
+            finished = pagination["next"] is None
+            last_page = self._last_page(pagination)
+        else:
+            finished = True
+
+        with ThreadPoolExecutor(max_workers=self._MAX_WORKERS) as executor:
+            if not finished and last_page is not None:
+                # `map` yields the pages in order, whatever order they
+                # arrive in.
+                for result in executor.map(fetch, range(2, last_page + 1)):
+                    if result is None:
+                        break
+                    add_page(result[0])
+                finished = True
+
+            page_number = 2
+            window = 2
+            while not finished:
+                window_pages = range(page_number, page_number + window)
+                for result in executor.map(fetch, window_pages):
+                    if result is None:
+                        finished = True
+                        break
+
+                    page_columns, pagination = result
+                    add_page(page_columns)
+                    if pagination["next"] is None:
+                        finished = True
+                        break
+
+                page_number += window
+                window = min(window * 2, self._MAX_WORKERS)
+
+        df = pd.DataFrame(data, copy=False)
+        return df
+
     def get_national_data(self):
         """ Retrieve national data from the API_data.
 
@@ -70,80 +392,53 @@ class CovidData:
              updated in the afternoon UK time) going back to the start
              of the pandemic UK data collection in March 2020.
         """
+        return self._fetch_national(self.nation)
+
+    def _fetch_national(self, nation, columns=None):
+        """Retrieve national data for `nation` from the API.
+
+        Takes the nation as an argument rather than reading self.nation
+        so that several nations can be fetched at the same time.
+        If `columns` is given only those columns (and the date) are
+        requested.
+        """
 
         area_type = 'nation'
         filters = [
                 f"areaType={ area_type }",
-                f"areaName={ self.nation }"
+                f"areaName={ nation }"
                 ]
 
-        structure = {
-            "date": "date",
-            "name": "areaName",
-            "case_newCases": "newCasesByPublishDate",
-            "case_newCasesChange": "newCasesByPublishDateChange",
-            "case_newCasesPercChange": "newCasesByPublishDateChangePercentage",
-            "case_rate": "newCasesBySpecimenDateRollingRate",
-            "case_cumulativeCases": "cumCasesByPublishDate",
-            "death_dailyDeaths": "newDeaths28DaysByPublishDate",
-            "death_newDeathRate": "newDeaths28DaysByDeathDateRate",
-            "death_cumulativeDeaths": "cumDeaths28DaysByDeathDate",
-            "death_cumulativeDeathsRate": "cumDeaths28DaysByDeathDateRate",
-            "death_Demographics": "newDeaths28DaysByDeathDateAgeDemographics",
-            "vac_first_dose": "cumPeopleVaccinatedFirstDoseByVaccinationDate",
-            "vac_second_dose": "cumPeopleVaccinatedSecondDoseByPublishDate",
-            "vac_total_perc":
-            "cumVaccinationCompleteCoverageByVaccinationDatePercentage",
-            "vac_demographics": "vaccinationsAgeDemographics",
-            "hosp_hospitalCases": "hospitalCases",
-            "hosp_newAdmissions": "newAdmissions",
-            "hosp_newAdmissionsChange": "newAdmissionsChange",
-            "hosp_covidOccupiedMVBeds": "covidOccupiedMVBeds"
-
-        }
-        StructureType = Dict[str, Union[dict, str]]
-        api_params = {
-            "filters": str.join(";", filters),
-            "structure": dumps(structure, separators=(",", ":"))
-        }
-
-        # response = get(self._ENDPOINT, params=api_params, timeout=10)
-
-        # if response.status_code >= 400:
-        #     raise RuntimeError(f'Request failed: { response.text }')
-
-        # data_json = response.json()
-        # df = pd.DataFrame(data_json['data'])
-        # return df
-
-        data = list()
-
-        page_number = 1
-
-        while True:
-            # Adding page number to query params
-            api_params["page"] = page_number
-
-            response = get(self._ENDPOINT, params=api_params, timeout=30)
-
-            if response.status_code >= HTTPStatus.BAD_REQUEST:
-                raise RuntimeError(f'Request failed: {response.text}')
-            elif response.status_code == HTTPStatus.NO_CONTENT:
-                break
-
-            current_data = response.json()
-            page_data: List[StructureType] = current_data['data']
-
-            data.extend(page_data)
-
-            # The "next" attribute in "pagination" will be `None`
-            # when we reach the end.
-            if current_data["pagination"]["next"] is None:
-                break
+        if columns is None:
+            df = self._get_data(filters, _NATIONAL_STRUCTURE,
+                                _NATIONAL_STRUCTURE_JSON)
+        else:
+            structure = {key: metric
+                         for key, metric in _NATIONAL_STRUCTURE.items()
+                         if key == 'date' or key in columns}
+            df = self._get_data(filters, structure)
+        return self._set_national_dtypes(df)
+
+    def _fetch_overview(self):
+        """Retrieve the UK-wide totals published by the API
+        (areaType=overview) for the columns in _OVERVIEW_STRUCTURE.
+        """
+        filters = [
+            "areaType=overview"
+        ]
+        df = self._get_data(filters, _OVERVIEW_STRUCTURE,
+                            _OVERVIEW_STRUCTURE_JSON)
+        return self._set_national_dtypes(df)
 
-            page_number += 1
-        df = pd.DataFrame(data)
-        return df
+    def _set_national_dtypes(self, df):
+        """Parse dates and cast the numeric columns of national (or
+        overview) data once, as whole columns.
+        """
+        df['date'] = pd.to_datetime(df['date'], format='%Y-%m-%d', cache=True)
+        dtypes = {column: dtype
+                  for column, dtype in self._NATIONAL_DTYPES.items()
+                  if column in df}
+        return df.astype(dtypes)
 
     def get_regional_data(self):
         """Retrieve regional data for 9 English regions. Regional data is not
@@ -166,62 +461,34 @@ class CovidData:
                                    +' `england`. Set nation to `england`.'
         area_type = 'region'
 
-        StructureType = Dict[str, Union[dict, str]]
         filters = [
                 f"areaType={ area_type }"
                 ]
 
-        structure = {
-            "date": "date",
-            "name": "areaName",
-            "cases_newDaily": "newCasesBySpecimenDate",
-            "cases_cumulative": "cumCasesBySpecimenDate",
-            "case_rate": "newCasesBySpecimenDateRollingRate",
-            "cases_demographics": "newCasesBySpecimenDateAgeDemographics",
-            "death_newDeathRate": "newDeaths28DaysByDeathDateRate",
-            "death_cumulativeDeaths": "cumDeaths28DaysByDeathDate",
-            "death_cumulativeDeathsRate": "cumDeaths28DaysByDeathDateRate",
-            "death_Demographics": "newDeaths28DaysByDeathDateAgeDemographics",
-            "vac_firstDose":
-            "cumVaccinationFirstDoseUptakeByVaccinationDatePercentage",
-            "vac_secondDose":
-            "cumVaccinationSecondDoseUptakeByVaccinationDatePercentage",
-            "vac_demographics": "vaccinationsAgeDemographics"
-            }
-
-        api_params = {
-            "filters": str.join(";", filters),
-            "structure": dumps(structure, separators=(",", ":"))
-        }
-
-        data = list()
-
-        page_number = 1
+        return self._get_data(filters, _REGIONAL_STRUCTURE,
+                              _REGIONAL_STRUCTURE_JSON)
 
-        while True:
-            # Adding page number to query params
-            api_params["page"] = page_number
+    def get_regional_dates(self):
+        """Retrieve only the dates of the regional data for England.
 
-            response = get(self._ENDPOINT, params=api_params, timeout=30)
-
-            if response.status_code >= HTTPStatus.BAD_REQUEST:
-                raise RuntimeError(f'Request failed: {response.text}')
-            elif response.status_code == HTTPStatus.NO_CONTENT:
-                break
-
-            current_data = response.json()
-            page_data: List[StructureType] = current_data['data']
+        Parameters:
+                - uses self.nation to assert that data for england is being
+                  collected.
 
-            data.extend(page_data)
+        Returns:
+            A pandas Series of the dates (as 'YYYY-MM-DD' strings) of the
+            rows get_regional_data returns, in the same order, without
+            downloading the rest of the regional data.
+        """
 
-            # The "next" attribute in "pagination" will be `None`
-            # when we reach the end.
-            if current_data["pagination"]["next"] is None:
-                break
+        assert self.nation == 'england', ('Regional data only available'
+                                          + ' for `england`. Set nation to'
+                                          + ' `england`.')
+        filters = ["areaType=region"]
 
-            page_number += 1
-        df = pd.DataFrame(data)
-        return df
+        data = self._get_data(filters, _REGIONAL_DATES_STRUCTURE,
+                              _REGIONAL_DATES_STRUCTURE_JSON)
+        return data['date']
 
     def get_local_data(self, date='date'):
         """Retrieve all the local authority data across the UK.
@@ -242,7 +509,6 @@ class CovidData:
         """
 
         AREA_TYPE = "ltla"
-        StructureType = Dict[str, Union[dict, str]]
         # this is local authority data
         filters = [
             f"areaType={ AREA_TYPE }",
@@ -250,46 +516,8 @@ class CovidData:
 
         ]
 
-        structure = {
-            "date": "date",
-            "name": "areaName",
-            "case_newDaily": "newCasesByPublishDate",
-            "case_cumulative": "cumCasesBySpecimenDate",
-            "case_rate": "newCasesBySpecimenDateRollingRate"
-            }
-
-        api_params = {
-            "filters": str.join(";", filters),
-            "structure": dumps(structure, separators=(",", ":"))
-        }
-        data = list()
-
-        page_number = 1
-
-        while True:
-            # Adding page number to query params
-            api_params["page"] = page_number
-
-            response = get(self._ENDPOINT, params=api_params, timeout=30)
-
-            if response.status_code >= HTTPStatus.BAD_REQUEST:
-                raise RuntimeError(f'Request failed: {response.text}')
-            elif response.status_code == HTTPStatus.NO_CONTENT:
-                break
-
-            current_data = response.json()
-            page_data: List[StructureType] = current_data['data']
-
-            data.extend(page_data)
-
-            # The "next" attribute in "pagination" will be `None`
-            # when we reach the end.
-            if current_data["pagination"]["next"] is None:
-                break
-
-            page_number += 1
-        df = pd.DataFrame(data)
-        return df
+        return self._get_data(filters, _LOCAL_STRUCTURE,
+                              _LOCAL_STRUCTURE_JSON)
 
     def get_uk_data(self):
         """Retrieve and combine all national data.
@@ -303,84 +531,33 @@ class CovidData:
                 contains date column, daily new cases, cumulative cases
                 daily death data, cumulative death data, hospital cases,
                 hospital new admissions, occupied mechanical ventilators.
+                Columns the API publishes UK-wide are read directly, the
+                others are the sum of the four nations.
         """
-        df = self.get_national_data()
-        self.nation = self._nations[2]
-        df_wales = self.get_national_data()
-        self.nation = self._nations[1]
-        df_scot = self.get_national_data()
-        self.nation = self._nations[3]
-        df_ni = self.get_national_data()
-
-        # If time I'll implement this. More efficient but requires
-        # reworking of plotting funtions.
-        # df_list = [df, df_wales, df_scot, df_ni]
-        # to_drop = ['death_Demographics', 'vac_demographics']
-
-        # for frame in df_list:
-        #     frame['date'] = pd.to_datetime(frame['date'])
-        #     frame.set_index('date', inplace=True)
-        #     frame.drop(columns=to_drop, inplace=True)
-
-        # df_total = df_ni.add(df_wales.add(df.add(df_scot)))
-
-        df_total = pd.DataFrame()
-        df_total = df_total.assign(date=df['date'])
-        df_total['date'] = pd.to_datetime(df_total['date'])
-        df_total = df_total.assign(nation=('United Kingdom'))
-        df_total = df_total.assign(case_newCases=(df_wales['case_newCases']
-                                   + df_ni['case_newCases']
-                                   + df_scot['case_newCases']
-                                   + df['case_newCases']))
-        df_total = df_total.assign(case_cumulativeCases=(
-                                   df_wales['case_cumulativeCases']
-                                   + df_ni['case_cumulativeCases']
-                                   + df_scot['case_cumulativeCases']
-                                   + df['case_cumulativeCases']))
-        df_total = df_total.assign(death_dailyDeaths=(
-                                   df_wales['death_dailyDeaths']
-                                   + df_ni['death_dailyDeaths']
-                                   + df_scot['death_dailyDeaths']
-                                   + df['death_dailyDeaths']))
-        df_total = df_total.assign(death_cumulativeDeaths=(
-                                   df_wales['death_cumulativeDeaths']
-                                   + df_ni['death_cumulativeDeaths']
-                                   + df_scot['death_cumulativeDeaths']
-                                   + df['death_cumulativeDeaths']))
-        df_total = df_total.assign(hosp_hospitalCases=(
-                                   df_wales['hosp_hospitalCases']
-                                   + df_ni['hosp_hospitalCases']
-                                   + df_scot['hosp_hospitalCases']
-                                   + df['hosp_hospitalCases']))
-        df_total = df_total.assign(hosp_newAdmissions=(
-                                   df_wales['hosp_newAdmissions']
-                                   + df_ni['hosp_newAdmissions']
-                                   + df_scot['hosp_newAdmissions']
-                                   + df['hosp_newAdmissions']))
-        df_total = df_total.assign(hosp_covidOccupiedMVBeds=(
-                                   df_wales['hosp_covidOccupiedMVBeds']
-                                   + df_ni['hosp_covidOccupiedMVBeds']
-                                   + df_scot['hosp_covidOccupiedMVBeds']
-                                   + df['hosp_covidOccupiedMVBeds']))
-        df_total = df_total.assign(hosp_newAdmissionsChange=(
-                                   df_wales['hosp_newAdmissionsChange']
-                                   + df_ni['hosp_newAdmissionsChange']
-                                   + df_scot['hosp_newAdmissionsChange']
-                                   + df['hosp_newAdmissionsChange']))
-        df_total = df_total.assign(vac_first_dose=(
-                                   df_wales['vac_first_dose']
-                                   + df_ni['vac_first_dose']
-                                   + df_scot['vac_first_dose']
-                                   + df['vac_first_dose']))
-        df_total = df_total.assign(vac_second_dose=(
-                                   df_wales['vac_second_dose']
-                                   + df_ni['vac_second_dose']
-                                   + df_scot['vac_second_dose']
-                                   + df['vac_second_dose']))
-        df_total = df_total.assign(vac_total_perc=(
-                                   df_wales['vac_total_perc']
-                                   + df_ni['vac_total_perc']
-                                   + df_scot['vac_total_perc']
-                                   + df['vac_total_perc']))
+        # UK totals published directly by the API come from a single
+        # overview request. Only the columns it does not cover are added
+        # up from the four nations, which are fetched at the same time
+        # with just those columns. self.nation is left untouched.
+        summed = [column for column in self._UK_COLUMNS
+                  if column not in _OVERVIEW_STRUCTURE]
+        fetch_nation = partial(self._fetch_national, columns=summed)
+        with ThreadPoolExecutor(max_workers=len(self._nations) + 1) as ex:
+            overview = ex.submit(self._fetch_overview)
+            nations = list(ex.map(fetch_nation, self._nations))
+            overview = overview.result()
+
+        # Line the nations up on the overview's dates (missing dates become
+        # NaN), stack them into a single (nations, rows, columns) array and
+        # add every column up in one reduction.
+        stacked = np.stack([
+            nation.set_index('date')[summed].reindex(overview['date'])
+            .to_numpy(dtype=np.float64)
+            for nation in nations])
+
+        # Lay out the final columns once, then fill the rest in place.
+        df_total = overview.reindex(
+            columns=['date', 'nation'] + self._UK_COLUMNS)
+        df_total['nation'] = 'United Kingdom'
+        df_total[summed] = stacked.sum(axis=0)
 
         return df_total
@@ -1,6 +1,11 @@
 from .data import CovidData
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import os
+import time
 from matplotlib.offsetbox import AnchoredText
+import numpy as np
 import pandas as pd
 import seaborn as sns
 
@@ -9,6 +14,45 @@ import geopandas as gpd
 import matplotlib.pyplot as plt
 plt.style.use('ggplot')
 
+# Batch runs that only save their plots can render off-screen
+_HEADLESS = bool(os.environ.get('COVIDATX_HEADLESS'))
+if _HEADLESS:
+    plt.switch_backend('Agg')
+
+# Read the geo_data shapefiles with pyogrio (vectorised, Arrow when
+# pyarrow is installed) rather than fiona's per-feature reader
+try:
+    import pyogrio  # noqa: F401
+    _READ_KWARGS = {'engine': 'pyogrio'}
+    try:
+        import pyarrow  # noqa: F401
+        _READ_KWARGS['use_arrow'] = True
+    except ImportError:
+        pass
+except ImportError:
+    _READ_KWARGS = {}
+
+# NUTS region names that differ from the gov.uk API's region names
+_NUTS_RENAME = {
+    'North East (England)': 'North East',
+    'North West (England)': 'North West',
+    'East Midlands (England)': 'East Midlands',
+    'West Midlands (England)': 'West Midlands',
+    'South East (England)': 'South East',
+    'South West (England)': 'South West',
+}
+
+# Wider age bands plotted by case_demographics and death_demographics;
+# bands left out of the map (00_59, unassigned, ...) are dropped
+_AGE_MAP = {
+    '00_04': 'under_15', '05_09': 'under_15', '10_14': 'under_15',
+    '15_19': 'age_15_29', '20_24': 'age_15_29', '25_29': 'age_15_29',
+    '30_34': 'age_30_39', '35_39': 'age_30_39',
+    '40_44': 'age_40_49', '45_49': 'age_40_49',
+    '50_54': 'age_50_59', '55_59': 'age_50_59',
+    '60+': '60+',
+}
+
 
 def pan_duration(date):
     """Return the duration in days of the pandemic.
@@ -24,6 +68,8 @@ def pan_duration(date):
     Returns:
         datetime: Duration of pandemic in days as datetime object.
     """
+    if hasattr(date, 'iloc'):
+        return (date.iloc[0] - date.iloc[-1]).days
     return (date[0] - date[-1]).days
 
 
@@ -61,7 +107,143 @@ def my_path():
     return base
 
 
-def daily_case_plot(df, pan_duration=pan_duration, save=False):
+def _read_geo_data(file_name):
+    """Read a shapefile from the geo_data sub-folder."""
+    try:
+        return gpd.read_file(my_path() / file_name, **_READ_KWARGS)
+    except Exception:
+        print('Ensure you have imported geo_data sub-folder')
+        raise
+
+
+@lru_cache(maxsize=None)
+def _load_nuts():
+    """Load the NUTS level 1 (UK regions) boundaries.
+
+    English region names are normalised to match the gov.uk API. The
+    frame is cached, so callers must not modify it in place; call
+    `_load_nuts.cache_clear()` if the shapefile on disk changes.
+
+    Returns:
+        GeoDataFrame: region boundaries keyed by the nuts118nm column.
+    """
+    geo_df = _read_geo_data('NUTS_Level_1_(January_2018)_Boundaries.shp')
+    names = geo_df['nuts118nm']
+    geo_df['nuts118nm'] = names.map(_NUTS_RENAME).fillna(names)
+    return geo_df
+
+
+@lru_cache(maxsize=None)
+def _load_lad():
+    """Load the Local Authority District boundaries.
+
+    The frame is cached, so callers must not modify it in place; call
+    `_load_lad.cache_clear()` if the shapefile on disk changes.
+
+    Returns:
+        GeoDataFrame: local authority boundaries keyed by lad19nm.
+    """
+    return _read_geo_data('Local_Authority_Districts.shp')
+
+
+# England's regional data is shared by the map and demographics plots;
+# a fetch is reused for _REGIONAL_TTL seconds
+_REGIONAL_TTL = 300
+_regional_cache = {}
+
+
+def _regional_cached():
+    """Return CovidData().get_regional_data(), reusing a recent fetch.
+
+    Callers must not modify the returned frame in place; call
+    `_regional_cached.cache_clear()` to force a fresh download.
+
+    Returns:
+        DataFrame: regional data for England, dates as datetime64.
+    """
+    cached = _regional_cache.get('regional')
+    if cached is None or time.monotonic() - cached[0] > _REGIONAL_TTL:
+        regional = CovidData().get_regional_data()
+        regional['date'] = pd.to_datetime(regional['date'],
+                                          format='%Y-%m-%d', cache=True)
+        cached = (time.monotonic(), regional)
+        _regional_cache['regional'] = cached
+    return cached[1]
+
+
+_regional_cached.cache_clear = _regional_cache.clear
+
+
+def _latest_date(offset=0):
+    """Return the date `offset` rows down the regional data.
+
+    Reads the cached regional data when it is fresh, otherwise fetches
+    the regional dates alone.
+
+    Args:
+        offset (int, optional): row of the regional data. Defaults to 0,
+            the most recent.
+
+    Returns:
+        str: date as 'YYYY-MM-DD'.
+    """
+    cached = _regional_cache.get('regional')
+    if cached is not None and time.monotonic() - cached[0] <= _REGIONAL_TTL:
+        return cached[1]['date'][offset].strftime('%Y-%m-%d')
+    return CovidData().get_regional_dates()[offset]
+
+
+def _fetch_uk_nations():
+    """Collect the data behind the regional maps of the UK.
+
+    The four API requests are independent, so they run concurrently.
+
+    Returns:
+        tuple: regional data for England, then national data for Scotland,
+        Wales and Northern Ireland.
+    """
+    def national(nation):
+        return CovidData(nation=nation).get_national_data()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        regions = executor.submit(_regional_cached)
+        nations = executor.map(national,
+                               ['scotland', 'wales', 'northern ireland'])
+        return (regions.result(), *nations)
+
+
+def _figure_axes(ax, figsize):
+    """Return `ax` with its figure, or a new figure and axes if it is None.
+
+    Returns:
+        tuple: figure, axes and whether the figure was created here.
+    """
+    if ax is None:
+        fig, ax = plt.subplots(1, figsize=figsize)
+        return fig, ax, True
+    return ax.figure, ax, False
+
+
+def _finish_plot(fig, save, file_name, dpi=None, owned=True):
+    """Save `fig` to `file_name` (at `dpi`) if requested, then show it.
+
+    A figure drawn on the caller's axes (`owned` False) is only saved;
+    showing and closing it is left to the caller. Headless runs
+    (COVIDATX_HEADLESS set) close a saved figure instead of showing it.
+    Outside interactive sessions the figure is closed once shown, so
+    repeated plots do not accumulate in pyplot's registry.
+    """
+    if save:
+        fig.savefig(file_name, dpi=dpi)
+    if not owned:
+        return
+    if not (save and _HEADLESS):
+        plt.show()
+    if _HEADLESS or not plt.isinteractive():
+        plt.close(fig)
+
+
+def daily_case_plot(df, pan_duration=pan_duration, save=False, ax=None):
     """Create a matplotlib plot of case numbers in the UK.
 
     Calculated over the duration of the pandemic.Display text information
@@ -74,23 +256,24 @@ def daily_case_plot(df, pan_duration=pan_duration, save=False):
             class using get_national_data() or get_UK_data() method.
         pan_duration (function, optional): Defaults to pan_duration.
         save (bool, optional): set True to save plot. Defaults to False.
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
     Returns:
             - Matplotlib plot, styled using matplotlib template 'ggplot'
     """
     # Create Variables we wish to plot
-    cases = df['case_newCases'].to_list()
-    date = df['date'].to_list()
-    cumulative = df['case_cumulativeCases'].to_list()
+    cases = df['case_newCases'].to_numpy()
+    date = pd.to_datetime(df['date'], cache=True)
+    cumulative = df['case_cumulativeCases'].iloc[0]
 
     # Find date of highest number of daily cases
-    high, arg_high = max(cases), cases.index(max(cases))
-    high_date = date[arg_high].strftime('%d %b %Y')
+    arg_high = np.nanargmax(cases)
+    high = cases[arg_high]
+    high_date = date.iloc[arg_high].strftime('%d %b %Y')
 
     duration = pan_duration(date=date)
     # Create matplotlib figure and specify size
-    fig = plt.figure(figsize=(12, 10))
-    plt.style.use('ggplot')
-    ax = fig.add_subplot()
+    fig, ax, own_fig = _figure_axes(ax, figsize=(12, 10))
     # Plot varibles
     ax.plot(date, cases)
     # Style and label plot
@@ -102,7 +285,7 @@ def daily_case_plot(df, pan_duration=pan_duration, save=False):
                  fontsize=18)
     at = AnchoredText(f"Most recent new cases\n{cases[0]:,.0f}\
                       \nMax new cases\n{high:,.0f}: {high_date}\
-                      \nCumulative cases\n{cumulative[0]:,.0f}\
+                      \nCumulative cases\n{cumulative:,.0f}\
                       \nPandemic duration\n{duration} days",
                       prop=dict(size=16), frameon=True, loc='upper left')
     at.patch.set_boxstyle("round,pad=0.,rounding_size=0.2")
@@ -111,72 +294,55 @@ def daily_case_plot(df, pan_duration=pan_duration, save=False):
                 xy=(0.25, 0.0175), xycoords='figure fraction',
                 fontsize=12, color='#555555')
 
-    plt.style.use('ggplot')
-    if save:
-        plt.savefig(f"{date[0].strftime('%Y-%m-%d')}-case_numbers_plot");
-    plt.show()
+    _finish_plot(fig, save,
+                 f"{date.iloc[0].strftime('%Y-%m-%d')}-case_numbers_plot",
+                 owned=own_fig)
 
 
-def regional_plot_cases(save=False):
+def regional_plot_cases(save=False, ax=None):
     """Plot regional case numbers on a map of the UK.
 
         Function collects data using CovidData get_regional_data method.
 
     Args:
         save (bool, optional): If true will save plot. Defaults to False.
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
     Returns:
         Plot of regional case numbers on map of UK
     """
     # Collect data
-    regions = CovidData().get_regional_data()
-    scotland = CovidData(nation='scotland').get_national_data()
-    wales = CovidData(nation='wales').get_national_data()
-    ni = CovidData(nation='northern ireland').get_national_data()
-    regions = regions.assign(case_newCases=regions['cases_newDaily'])
+    regions, scotland, wales, ni = _fetch_uk_nations()
     # Set date to plot
-    date_selector = regions['date'][0]
-    regions_date = regions.loc[regions['date'] == date_selector]
+    date_selector = regions['date'].iloc[0]
+    regions_date = regions.loc[regions['date'].eq(date_selector),
+                               ['date', 'name', 'cases_newDaily']]
+    regions_date = \
+        regions_date.rename(columns={'cases_newDaily': 'case_newCases'})
     scotland_date = \
-        scotland.loc[scotland['date'] == date_selector,
+        scotland.loc[scotland['date'].eq(date_selector),
                      ['date', 'name', 'case_newCases']]
-    wales_date = wales.loc[wales['date'] == date_selector,
+    wales_date = wales.loc[wales['date'].eq(date_selector),
                            ['date', 'name', 'case_newCases']]
-    ni_date = ni.loc[ni['date'] == date_selector,
+    ni_date = ni.loc[ni['date'].eq(date_selector),
                      ['date', 'name', 'case_newCases']]
     # Combine regional data into single dataframe
     final_df = pd.concat([regions_date, scotland_date, wales_date, ni_date],
                          axis=0)
-    file_path = my_path() / 'NUTS_Level_1_(January_2018)_Boundaries.shp'
-    # Check required file exists
-    try:
-        # Read shape file
-        geo_df = gpd.read_file(file_path)
-    except: # bare except is not good practice, this should be changed
-        print('Ensure you have imported geo_data sub-folder')
-
-    geo_df['nuts118nm'] = \
-        geo_df['nuts118nm'].replace(['North East (England)',
-                                     'North West (England)',
-                                     'East Midlands (England)',
-                                     'West Midlands (England)',
-                                     'South East (England)',
-                                     'South West (England)'],
-                                    ['North East', 'North West',
-                                     'East Midlands', 'West Midlands',
-                                     'South East', 'South West'])
-    merged = geo_df.merge(final_df, how='left', left_on="nuts118nm",
-                          right_on="name")
-
+    geo_df = _load_nuts()
     # Column to plot
     feature = 'case_newCases'
+    # Look up each area's value by name
+    lookup = final_df.set_index('name')[feature]
+    merged = geo_df.assign(**{feature: geo_df['nuts118nm'].map(lookup)})
     # Plot range
     feature_min, feature_max = merged['case_newCases'].min(), \
         merged['case_newCases'].max()
     # Create plot
-    fig, ax = plt.subplots(1, figsize=(12, 10))
+    fig, ax, own_fig = _figure_axes(ax, figsize=(12, 10))
     # Set style and labels
     ax.axis('off')
-    ax.set_title(f'Number of new cases per region {date_selector}',
+    ax.set_title(f'Number of new cases per region {date_selector:%Y-%m-%d}',
                  fontdict={'fontsize': '18', 'fontweight': '3'})
     ax.annotate('Source: gov.uk'
                 + ' https://api.coronavirus.data.gov.uk/v1/data',
@@ -186,71 +352,52 @@ def regional_plot_cases(save=False):
     sm = plt.cm.ScalarMappable(cmap='Reds',
                                norm=plt.Normalize(vmin=feature_min,
                                                   vmax=feature_max))
-    fig.colorbar(sm)
+    fig.colorbar(sm, ax=ax)
     # Create map
     merged.plot(column=feature, cmap='Reds', linewidth=0.8, ax=ax,
-                edgecolor='0.8');
-    plt.show()
-    if save:
-        image = merged.plot(column=feature, cmap='Reds', linewidth=0.8,
-                            ax=ax, edgecolor='0.8');
-        image.figure.savefig(f'{date_selector}-regional_cases_plot')
+                edgecolor='0.8', rasterized=True)
+    _finish_plot(fig, save, f'{date_selector:%Y-%m-%d}-regional_cases_plot',
+                 dpi=120, owned=own_fig)
 
 
-def regional_plot_rate(save=False):
+def regional_plot_rate(save=False, ax=None):
     """Plot regional case rate per 100,000 on a map of the UK.
 
        Function collects data using CovidData get_regional_data method.
     Args:
         save (bool, optional): If true will save plot. Defaults to False.
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
     Returns:
         Plot of regional case rate on map of UK.
     """
     # Collect data
-    regions = CovidData().get_regional_data()
-    scotland = CovidData(nation='scotland').get_national_data()
-    wales = CovidData(nation='wales').get_national_data()
-    ni = CovidData(nation='northern ireland').get_national_data()
+    regions, scotland, wales, ni = _fetch_uk_nations()
 
     # Set date to plot
-    date_selector = regions['date'][5]
-    regions_date = regions.loc[regions['date'] == date_selector]
-    scotland_date = scotland.loc[scotland['date'] == date_selector,
+    date_selector = regions['date'].iloc[5]
+    regions_date = regions.loc[regions['date'].eq(date_selector),
+                               ['date', 'name', 'case_rate']]
+    scotland_date = scotland.loc[scotland['date'].eq(date_selector),
                                  ['date', 'name', 'case_rate']]
-    wales_date = wales.loc[wales['date'] == date_selector,
+    wales_date = wales.loc[wales['date'].eq(date_selector),
                            ['date', 'name', 'case_rate']]
-    ni_date = ni.loc[ni['date'] == date_selector,
+    ni_date = ni.loc[ni['date'].eq(date_selector),
                      ['date', 'name', 'case_rate']]
     # Combine regional data into single dataframe
     final_df = pd.concat([regions_date, scotland_date, wales_date, ni_date],
                          axis=0)
-    file_path = my_path() / 'NUTS_Level_1_(January_2018)_Boundaries.shp'
-    # Check required file exists
-    try:
-        # Read shape file
-        geo_df = gpd.read_file(file_path)
-    except:  # bare except should be changed, will do so in later interation
-        print('Ensure you have imported geo_data sub-folder')
-
-    geo_df['nuts118nm'] = \
-        geo_df['nuts118nm'].replace(['North East (England)',
-                                     'North West (England)',
-                                     'East Midlands (England)',
-                                     'West Midlands (England)',
-                                     'South East (England)',
-                                     'South West (England)'],
-                                    ['North East', 'North West',
-                                     'East Midlands', 'West Midlands',
-                                     'South East', 'South West'])
-    merged = geo_df.merge(final_df, how='left', left_on="nuts118nm",
-                          right_on="name")
+    geo_df = _load_nuts()
     # Column to plot
     feature = 'case_rate'
+    # Look up each area's value by name
+    lookup = final_df.set_index('name')[feature]
+    merged = geo_df.assign(**{feature: geo_df['nuts118nm'].map(lookup)})
     # Plot range
     feature_min, feature_max = merged['case_rate'].min(),\
         merged['case_rate'].max()
     # Create plot
-    fig, ax = plt.subplots(1, figsize=(12, 10))
+    fig, ax, own_fig = _figure_axes(ax, figsize=(12, 10))
     # Set style and labels
     ax.axis('off')
     ax.set_title('Regional rate per 100,000 (new cases)',
@@ -263,93 +410,84 @@ def regional_plot_rate(save=False):
     sm = plt.cm.ScalarMappable(cmap='Reds',
                                norm=plt.Normalize(vmin=feature_min,
                                                   vmax=feature_max))
-    fig.colorbar(sm)
+    fig.colorbar(sm, ax=ax)
     # Create map
     merged.plot(column=feature, cmap='Reds', linewidth=0.8, ax=ax,
-                edgecolor='0.8');
-    plt.show()
-    if save:
-        image = merged.plot(column=feature, cmap='Reds', linewidth=0.8,
-                            ax=ax, edgecolor='0.8');
-        image.figure.savefig(f'{date_selector}-regional_rate_plot')
+                edgecolor='0.8', rasterized=True)
+    _finish_plot(fig, save, f'{date_selector:%Y-%m-%d}-regional_rate_plot',
+                 dpi=120, owned=own_fig)
 
 
-def heatmap_cases(df):
+def heatmap_cases(df, ax=None):
     """Create heatmap of case numbers for duration of pandemic.
 
     Args:
         df (DataFrame): Covid case data retrieved by calling CovidData
                         class method.
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
     Returns:
         Seaborn heatmap plot of case numbers for each day of the pandemic.
     """
-    # Variables to plot
-    cases = df['case_newCases'].to_list()
-    date = df['date'].to_list()
-
-    # Create new DataFrame containing two columns: date and case numbers
-    heat_df = pd.DataFrame({'date': date, 'cases': cases}, index=date)
+    # Case numbers with the date separated out into year, month and day
+    date = pd.to_datetime(df['date'], cache=True).dt
+    heat_df = pd.DataFrame({'cases': df['case_newCases'].to_numpy(),
+                            'year': date.year.to_numpy(),
+                            'month': date.month.to_numpy(),
+                            'day': date.day.to_numpy()})
 
-    # Separate out date into year month and day
-    heat_df['year'] = heat_df.index.year
-    heat_df["month"] = heat_df.index.month
-    heat_df['day'] = heat_df.index.day
-
-    # Use groupby to convert data to wide format for heatmap plot
-    x = heat_df.groupby(["year", "month", "day"])["cases"].sum()
-    df_wide = x.unstack()
+    # Convert data to wide format for heatmap plot
+    df_wide = heat_df.pivot_table(values='cases', index=['year', 'month'],
+                                  columns='day', aggfunc='sum')
 
     # Plot data
     sns.set(rc={"figure.figsize": (12, 10)})
     # Reverse colormap so that dark colours represent higher numbers
     cmap = sns.cm.rocket_r
-    ax = sns.heatmap(df_wide, cmap=cmap)
+    fig, ax, own_fig = _figure_axes(ax, figsize=(12, 10))
+    ax = sns.heatmap(df_wide, cmap=cmap, ax=ax)
 
     ax.set_title('Heatmap of daily cases since start of pandemic',
                  fontsize=20)
     ax.annotate('Source: gov.uk https://api.coronavirus.data.gov.uk/v1/data',
                 xy=(0.25, 0.01), xycoords='figure fraction',
                 fontsize=12, color='#555555')
-    plt.show()
+    _finish_plot(fig, False, None, owned=own_fig)
 
 
-def local_rate_plot(save=False):
+def local_rate_plot(save=False, ax=None):
     """Plot local case rate per 100,000 on a map of the UK.
 
     Function collects data using CovidData get_regional_data method.
 
     Args:
         save (bool, optional): If true will save plot. Defaults to False.
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
     Returns:
         Plot of local case rate on map of UK
     """
     # Find latest data
-    recent_date = CovidData().get_regional_data()
-    recent_date = recent_date['date'][5]
+    recent_date = _latest_date(5)
     # Select latest data from local data
     local = CovidData().get_local_data(date=recent_date)
     date_selector = recent_date
     local_date = local.loc[local['date'] == date_selector,
                            ['date', 'name', 'case_rate']]
-    file_path = my_path() / "Local_Authority_Districts.shp"
-    # Check required file exists
-    try:
-        # Read shape file
-        geo_df = gpd.read_file(file_path)
-    except:  # bare except should be changed, will do so in later interation
-        print('Ensure you have imported geo_data sub-folder')
+    geo_df = _load_lad()
 
     local_date['name'] = \
         local_date['name'].replace(['Cornwall and Isles of Scilly'],
                                    ['Cornwall'])
-    merged = geo_df.merge(local_date, how='outer',
-                          left_on="lad19nm", right_on="name")
     # Column to plot
     feature = 'case_rate'
+    # Look up each area's value by name
+    lookup = local_date.set_index('name')[feature]
+    merged = geo_df.assign(**{feature: geo_df['lad19nm'].map(lookup)})
     # Plot range
     vmin, vmax = merged['case_rate'].min(), merged['case_rate'].max()
     # Create plot
-    fig, ax = plt.subplots(1, figsize=(12, 10))
+    fig, ax, own_fig = _figure_axes(ax, figsize=(12, 10))
     # Set style and labels
     ax.axis('off')
     ax.set_title(f'Local rate per 100,000 {recent_date}',
@@ -361,53 +499,45 @@ def local_rate_plot(save=False):
     # Create colorbar
     sm = plt.cm.ScalarMappable(cmap='Reds',
                                norm=plt.Normalize(vmin=vmin, vmax=vmax))
-    fig.colorbar(sm)
+    fig.colorbar(sm, ax=ax)
     # Create map
     merged.plot(column=feature, cmap='Reds', linewidth=0.2, ax=ax,
-                edgecolor='0.8')
-    plt.show()
-    if save:
-        image = merged.plot(column=feature, cmap='Reds', linewidth=0.2,
-                            ax=ax, edgecolor='0.8');
-        image.figure.savefig(f'{date_selector}-local_rate_plot')
+                edgecolor='0.8', rasterized=True)
+    _finish_plot(fig, save, f'{date_selector}-local_rate_plot',
+                 dpi=120, owned=own_fig)
 
 
-def local_cases_plot(save=False):
+def local_cases_plot(save=False, ax=None):
     """Plot local case numbers on a map of the UK.
 
     Function collects data using CovidData get_regional_data method.
 
     Args:
         save (bool, optional): If true will save plot. Defaults to False.
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
     """
     # Find latest data
-    recent_date = CovidData().get_regional_data()
-    recent_date = recent_date['date'][0]
+    recent_date = _latest_date(0)
     # Select latest data from local data
     local = CovidData().get_local_data(date=recent_date)
     date_selector = recent_date
     local_date = local.loc[local['date'] == date_selector,
                            ['date', 'name', 'case_newDaily']]
-    file_path = my_path() / "Local_Authority_Districts.shp"
-    # Check required file exists
-    try:
-        # Read shape file
-        geo_df = gpd.read_file(file_path)
-
-    except:  # bare except should be changed, will do so in later interation
-        print('Ensure you have imported geo_data sub-folder')
+    geo_df = _load_lad()
     local_date['name'] = \
         local_date['name'].replace(['Cornwall and Isles of Scilly'],
                                    ['Cornwall'])
-    merged = geo_df.merge(local_date, how='outer',
-                          left_on="lad19nm", right_on="name")
     # Column to plot
     feature = 'case_newDaily'
+    # Look up each area's value by name
+    lookup = local_date.set_index('name')[feature]
+    merged = geo_df.assign(**{feature: geo_df['lad19nm'].map(lookup)})
     # Plot range
     vmin, vmax = merged['case_newDaily'].min(), \
         merged['case_newDaily'].max()
     # Create plot
-    fig, ax = plt.subplots(1, figsize=(12, 10))
+    fig, ax, own_fig = _figure_axes(ax, figsize=(12, 10))
     # Set style and labels
     ax.axis('off')
     ax.set_title(f'Number of new cases by local authority {recent_date}',
@@ -419,15 +549,66 @@ def local_cases_plot(save=False):
     # Create colorbar
     sm = plt.cm.ScalarMappable(cmap='Reds',
                                norm=plt.Normalize(vmin=vmin, vmax=vmax))
-    fig.colorbar(sm)
+    fig.colorbar(sm, ax=ax)
     # Create map
     merged.plot(column=feature, cmap='Reds', linewidth=0.2, ax=ax,
-                edgecolor='0.8')
-    plt.show()
-    if save:
-        image = merged.plot(column=feature, cmap='Reds', linewidth=0.2,
-                            ax=ax, edgecolor='0.8');
-        image.figure.savefig(f'{date_selector}-local_cases_plot')
+                edgecolor='0.8', rasterized=True)
+    _finish_plot(fig, save, f'{date_selector}-local_cases_plot',
+                 dpi=120, owned=own_fig)
+
+
+def _demographics_pivot(df, column, values):
+    """Tabulate a nested demographics column of the regional data by age.
+
+    Args:
+        df (DataFrame): data from get_regional_data method.
+        column (str): column holding each row's list of per-age records.
+        values (str): record field to tabulate.
+
+    Returns:
+        DataFrame: `values` (float32) indexed by date, with one column per
+        age band.
+    """
+    # Flatten every row's records into one long frame and pivot it once
+    records = []
+    for payload, date in zip(df[column], df['date']):
+        if payload:
+            records.extend({**record, 'date': date} for record in payload)
+    data = pd.DataFrame.from_records(records)
+    # Numeric float32 values keep the pivot and resample off the object
+    # path and halve the size of the plotted data
+    data[values] = pd.to_numeric(data[values], errors='coerce',
+                                 downcast='float')
+    data = data.pivot_table(values=values, index='date', columns='age',
+                            aggfunc='mean', dropna=False)
+    data.index = pd.to_datetime(data.index)
+    return data
+
+
+def _age_band_mean(data):
+    """Average the age band columns of `data` into the bands of _AGE_MAP.
+
+    Args:
+        data (DataFrame): age band columns, as from _demographics_pivot.
+
+    Returns:
+        DataFrame: one column per wider band; like mean(), missing values
+        are skipped.
+    """
+    ages = [age for age in data.columns if age in _AGE_MAP]
+    bands = list(dict.fromkeys(_AGE_MAP[age] for age in ages))
+    values = data[ages].to_numpy()
+    # 0/1 matrix assigning each age column to its band, so the band sums
+    # and counts are each a single matrix product
+    members = np.zeros((len(ages), len(bands)), dtype=values.dtype)
+    members[np.arange(len(ages)),
+            [bands.index(_AGE_MAP[age]) for age in ages]] = 1
+    present = ~np.isnan(values)
+    sums = np.where(present, values, 0) @ members
+    counts = present @ members
+    with np.errstate(invalid='ignore'):
+        means = sums / counts
+    return pd.DataFrame(means, index=data.index, columns=bands)
 
 
 def case_demographics(df):
@@ -440,34 +621,14 @@ def case_demographics(df):
         Plot of case numbers broken down by age
     """
     validate_input(df)
-    df_list = df.loc[:, ['cases_demographics', 'date']]
-    age_df = []
-    for i in range(df_list.shape[0]):
-        if df_list.iloc[i, 0]:
-            temp_df = pd.DataFrame(df_list.iloc[i, 0])
-            temp_df['date'] = df_list.iloc[i, 1]
-            temp_df = temp_df.pivot(values='rollingRate',
-                                    columns='age', index='date')
-            age_df.append(temp_df)
-    data = pd.concat(age_df)
-    data.index = pd.to_datetime(data.index)
-    data = \
-        data.assign(under_15=(data['00_04']+data['05_09']+data['10_14'])/3,
-                    age_15_29=(data['15_19']+data['20_24']+data['25_29'])/3,
-                    age_30_39=(data['30_34']+data['35_39'])/2,
-                    age_40_49=(data['40_44']+data['45_49'])/2,
-                    age_50_59=(data['50_54']+data['55_59'])/2)
-    data.drop(columns=['00_04', '00_59', '05_09', '10_14', '15_19', '20_24',
-                       '25_29', '30_34', '35_39', '40_44', '45_49', '50_54',
-                       '55_59', '60_64', '65_69', '70_74', '75_79', '80_84',
-                       '85_89', '90+', 'unassigned'], inplace=True)
-    date = data.index[0].strftime('%d-%b-%y')
+    data = _demographics_pivot(df, 'cases_demographics', 'rollingRate')
+    data = _age_band_mean(data)
+    date = data.index.max().strftime('%d-%b-%y')
     ready_df = data.resample('W').mean()
     ready_df.plot(figsize=(15, 10), subplots=True, layout=(3, 3),
                   title=f'{date} - England case rate per 100,000 by age'
                   + ' (weekly)')
-    plt.style.use('ggplot')
-    plt.show()
+    _finish_plot(plt.gcf(), False, None)
 
 
 def vaccine_demographics(df):
@@ -480,26 +641,15 @@ def vaccine_demographics(df):
         Plot of cumulative third vaccination numbers broken down by age.
     """
     validate_input(df)
-    df_list = df.loc[:, ['vac_demographics', 'date']]
-    age_df = []
-    for i in range(df_list.shape[0]):
-        if df_list.iloc[i, 0]:
-            temp_df = pd.DataFrame(df_list.iloc[i, 0])
-            temp_df['date'] = df_list.iloc[i, 1]
-            temp_df =\
-                temp_df.pivot(values=
-            'cumVaccinationThirdInjectionUptakeByVaccinationDatePercentage',
-                              columns='age', index='date')
-            age_df.append(temp_df)
-    data = pd.concat(age_df)
-    data.index = pd.to_datetime(data.index)
-    date = data.index[0].strftime('%d-%b-%y')
+    data = _demographics_pivot(
+        df, 'vac_demographics',
+        'cumVaccinationThirdInjectionUptakeByVaccinationDatePercentage')
+    date = data.index.max().strftime('%d-%b-%y')
     ready_df = data.resample('W').mean()
     ready_df.plot(figsize=(15, 10), subplots=True, layout=(6, 3),
                   title=f'{date} - England vaccine booster uptake (%) by age'
                   + ' (weekly)')
-    plt.style.use('ggplot')
-    plt.show()
+    _finish_plot(plt.gcf(), False, None)
 
 
 def death_demographics(df):
@@ -512,38 +662,17 @@ def death_demographics(df):
         Plot of death rate per 100,000 broken down by age.
     """
     validate_input(df)
-    df_list = df.loc[:, ['death_Demographics', 'date']]
-    age_df = []
-    for i in range(df_list.shape[0]):
-        if df_list.iloc[i, 0]:
-            temp_df = pd.DataFrame(df_list.iloc[i, 0])
-            temp_df['date'] = df_list.iloc[i, 1]
-            temp_df = temp_df.pivot(values='rollingRate',
-                                    columns='age', index='date')
-            age_df.append(temp_df)
-    data = pd.concat(age_df)
-    data.index = pd.to_datetime(data.index)
-    data = \
-        data.assign(under_15=(data['00_04']+data['05_09']+data['10_14'])/3,
-                    age_15_29=(data['15_19']+data['20_24']+data['25_29'])/3,
-                    age_30_39=(data['30_34']+data['35_39'])/2,
-                    age_40_49=(data['40_44']+data['45_49'])/2,
-                    age_50_59=(data['50_54']+data['55_59'])/2)
-    data.drop(columns=['00_04', '00_59', '05_09', '10_14', '15_19', '20_24',
-                       '25_29', '30_34', '35_39', '40_44', '45_49', '50_54',
-                       '55_59', '60_64', '65_69', '70_74', '75_79', '80_84',
-                       '85_89', '90+'], inplace=True)
-
-    date = data.index[0].strftime('%d-%b-%y')
+    data = _demographics_pivot(df, 'death_Demographics', 'rollingRate')
+    data = _age_band_mean(data)
+    date = data.index.max().strftime('%d-%b-%y')
     ready_df = data.resample('W').mean()
     ready_df.plot(figsize=(15, 10), subplots=True, layout=(3, 3),
                   title=f'{date} - England death rate per 100,000 by age'
                   + ' (weekly)')
-    plt.style.use('ggplot')
-    plt.show()
+    _finish_plot(plt.gcf(), False, None)
 
 
-def daily_deaths(df, pan_duration=pan_duration, save=False):
+def daily_deaths(df, pan_duration=pan_duration, save=False, ax=None):
     """Plot number of people died per day within 28 days of 1st +ve test.
 
        COVID-19 deaths over time, from the start of the pandemic March 2020.
@@ -553,22 +682,23 @@ def daily_deaths(df, pan_duration=pan_duration, save=False):
         pan_duration (function, optional): use pre specified pan_duration.
         Defaults to pan_duration.
         save (bool, optional): [description]. Defaults to False.
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
     Returns:
         Matplotlib plot, styled using matplotlib template 'ggplot'
     """
-    daily_deaths = df['death_dailyDeaths'].to_list()
-    date = df['date'].to_list()
+    daily_deaths = df['death_dailyDeaths'].to_numpy()
+    date = pd.to_datetime(df['date'], cache=True)
     # cumulative = df['case_cumulativeCases'].to_list()
     # Find date of highest number of daily cases
-    high, arg_high = max(daily_deaths), daily_deaths.index(max(daily_deaths))
+    arg_high = np.nanargmax(daily_deaths)
+    high = daily_deaths[arg_high]
     # daily = df['death_dailyDeaths'][0]
-    high_date = date[arg_high].strftime('%d %b %Y')
+    high_date = date.iloc[arg_high].strftime('%d %b %Y')
     # added the number of death for the last seven days
     duration = pan_duration(date=date)
     # Create matplotlib figure and specify size
-    fig = plt.figure(figsize=(12, 10))
-    plt.style.use('ggplot')
-    ax = fig.add_subplot()
+    fig, ax, own_fig = _figure_axes(ax, figsize=(12, 10))
     # Plot varibles
     ax.plot(date, daily_deaths)
 
@@ -592,12 +722,11 @@ def daily_deaths(df, pan_duration=pan_duration, save=False):
                 xy=(0.25, 0.0175), xycoords='figure fraction',
                 fontsize=12, color='#555555')
 
-    if save:
-        plt.savefig(f"casenumbers{date[0].strftime('%Y-%m-%d')}")
-    plt.show()
+    _finish_plot(fig, save, f"casenumbers{date.iloc[0].strftime('%Y-%m-%d')}",
+                 owned=own_fig)
 
 
-def cumulative_deaths(df, pan_duration=pan_duration, save=False):
+def cumulative_deaths(df, pan_duration=pan_duration, save=False, ax=None):
     """Plot cum number of people who died within 28 days of +ve test.
 
         Total COVID-19 deaths over time, from the start of the
@@ -607,22 +736,24 @@ def cumulative_deaths(df, pan_duration=pan_duration, save=False):
         df (DataFrame): containing covid data retrieved from CovidData
         pan_duration ([function], optional): Defaults to pan_duration.
         save (bool, optional): True to save plot. Defaults to False.
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
     Returns:
         Matplotlib plot, styled using matplotlib template 'ggplot'
     """
     df = df.fillna(0)
-    cum_deaths = df["death_cumulativeDeaths"].to_list()
-    date = df['date'].to_list()
+    cum_deaths = df["death_cumulativeDeaths"].to_numpy()
+    date = pd.to_datetime(df['date'], cache=True)
     # cumulative = df['death_cumulativeDeaths'].to_list()
     # Find date of highest number of daily cases
-    high, arg_high = max(cum_deaths), cum_deaths.index(max(cum_deaths))
+    arg_high = np.nanargmax(cum_deaths)
+    high = cum_deaths[arg_high]
     # daily = df["death_cumulativeDeaths"][0]
-    high_date = date[arg_high].strftime('%d %b %Y')
+    high_date = date.iloc[arg_high].strftime('%d %b %Y')
     # added the number of death for the last seven days
     duration = pan_duration(date=date)
     # Create matplotlib figure and specify size
-    fig = plt.figure(figsize=(12, 10))
-    ax = fig.add_subplot()
+    fig, ax, own_fig = _figure_axes(ax, figsize=(12, 10))
     # Plot varibles
     ax.plot(date, cum_deaths)
     # Style and label plot
@@ -641,66 +772,49 @@ def cumulative_deaths(df, pan_duration=pan_duration, save=False):
     ax.annotate('Source: gov.uk https://api.coronavirus.data.gov.uk/v1/data',
                 xy=(0.25, 0.0175), xycoords='figure fraction',
                 fontsize=12, color='#555555')
-    plt.style.use('ggplot')
-    if save:
-        plt.savefig(f"casenumbers{date[0].strftime('%Y-%m-%d')}")
-    plt.show()
+    _finish_plot(fig, save, f"casenumbers{date.iloc[0].strftime('%Y-%m-%d')}",
+                 owned=own_fig)
 
 
-def regional_plot_death_rate(save=False):
+def regional_plot_death_rate(save=False, ax=None):
     """Plot regional deaths rate per 100,000 on a map of the UK.
 
     Function collects data using CovidData get_regional_data method.
 
     Args:
         save (bool, optional): True will save plot. Defaults to False.
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
     Returns:
         Plot of regional case rate on map of UK
     """
     # Collect data
-    regions = CovidData().get_regional_data()
-    scotland = CovidData(nation='scotland').get_national_data()
-    wales = CovidData(nation='wales').get_national_data()
-    ni = CovidData(nation='northern ireland').get_national_data()
+    regions, scotland, wales, ni = _fetch_uk_nations()
 
     # Set date to plot
-    date_selector = regions['date'][7]
-    regions_date = regions.loc[regions['date'] == date_selector]
-    scotland_date = scotland.loc[scotland['date'] == date_selector,
+    date_selector = regions['date'].iloc[7]
+    regions_date = regions.loc[regions['date'].eq(date_selector),
+                               ['date', 'name', 'death_newDeathRate']]
+    scotland_date = scotland.loc[scotland['date'].eq(date_selector),
                                  ['date', 'name', 'death_newDeathRate']]
-    wales_date = wales.loc[wales['date'] == date_selector,
+    wales_date = wales.loc[wales['date'].eq(date_selector),
                            ['date', 'name', 'death_newDeathRate']]
-    ni_date = ni.loc[ni['date'] == date_selector,
+    ni_date = ni.loc[ni['date'].eq(date_selector),
                      ['date', 'name', 'death_newDeathRate']]
     # Combine regional data into single dataframe
     final_df = pd.concat([regions_date, scotland_date, wales_date, ni_date],
                          axis=0)
-    file_path = my_path() / 'NUTS_Level_1_(January_2018)_Boundaries.shp'
-    # Check required file exists
-    try:
-        # Read shape file
-        geo_df = gpd.read_file(file_path)
-    except:  # bare except should be changed, will do so in later interation
-        print('Ensure you have imported geo_data sub-folder')
-    geo_df['nuts118nm'] = \
-        geo_df['nuts118nm'].replace(['North East (England)',
-                                     'North West (England)',
-                                     'East Midlands (England)',
-                                     'West Midlands (England)',
-                                     'South East (England)',
-                                     'South West (England)'],
-                                    ['North East', 'North West',
-                                     'East Midlands', 'West Midlands',
-                                     'South East', 'South West'])
-    merged = geo_df.merge(final_df, how='left', left_on="nuts118nm",
-                          right_on="name")
+    geo_df = _load_nuts()
     # Column to plot
     feature = 'death_newDeathRate'
+    # Look up each area's value by name
+    lookup = final_df.set_index('name')[feature]
+    merged = geo_df.assign(**{feature: geo_df['nuts118nm'].map(lookup)})
     # Plot range
     feature_min, feature_max = merged['death_newDeathRate'].min(),\
         merged['death_newDeathRate'].max()
     # Create plot
-    fig, ax = plt.subplots(1, figsize=(12, 10))
+    fig, ax, own_fig = _figure_axes(ax, figsize=(12, 10))
     # Set style and labels
     ax.axis('off')
     ax.set_title('Regional rate per 100,000 (new deaths)',
@@ -713,18 +827,15 @@ def regional_plot_death_rate(save=False):
     sm = plt.cm.ScalarMappable(cmap='Reds',
                                norm=plt.Normalize(vmin=feature_min,
                                                   vmax=feature_max))
-    fig.colorbar(sm)
+    fig.colorbar(sm, ax=ax)
     # Create map
     merged.plot(column=feature, cmap='Reds', linewidth=0.8, ax=ax,
-                edgecolor='0.8')
-    plt.show()
-    if save:
-        image = merged.plot(column=feature, cmap='Reds', linewidth=0.8,
-                            ax=ax, edgecolor='0.8')
-        image.figure.savefig(f'caserates{date_selector}')
+                edgecolor='0.8', rasterized=True)
+    _finish_plot(fig, save, f'caserates{date_selector:%Y-%m-%d}',
+                 dpi=120, owned=own_fig)
 
 
-def regional_deaths_demo(save=False):
+def regional_deaths_demo(save=False, ax=None):
     """Plot number of deaths in the UK.
 
        Plot by age category (>60 , <60). Function collects data using
@@ -732,418 +843,457 @@ def regional_deaths_demo(save=False):
 
     Args:
         save (bool, optional): True will save plot. Defaults to False.
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
     Returns:
         Plot of regional deaths by age category (UK)
     """
-    CovidDataE = CovidData("england")
-    regional = CovidDataE.get_regional_data()
-    regional = \
-        regional.drop(regional.columns.difference(["date",
-                                                   "death_Demographics"]), 1)
-
-    regional
-    # remove empty lists in 'death_Demographcs column'
-    regional = regional[regional["death_Demographics"].astype(bool)]
-
-    # transform the regional dataframe to have 'age_categories' as columns
-    # with 'deaths' values and 'date' as rows
-    age_df = []
-    for i in range(regional.shape[0]):
-        if regional.iloc[i, 1]:
-            temp_df = pd.DataFrame(regional.iloc[i, 1])
-            temp_df['date'] = regional.iloc[i, 0]
-            temp_df = temp_df.pivot(values='deaths', columns=['age'],
-                                    index='date')
-            age_df.append(temp_df)
-    final_death_data = pd.concat(age_df)
-    # create a dataframe with columns 'age category' and 'number of deaths'
+    regional = _regional_cached()
     age_cat = ['00_04', '00_59', '05_09', '10_14', '15_19', '20_24', '25_29',
                '30_34', '35_39', '40_44', '45_49', '50_54', '55_59', '60+',
                '60_64', '65_69', '70_74', '75_79', '80_84', '85_89', '90+']
-    deaths = []
-    for ele in age_cat:
-        x = final_death_data[ele].sum()
-        deaths.append(x)
-
-    deaths_df = pd.DataFrame(list(zip(age_cat, deaths)),
-                             columns=['age category', 'number of deaths'])
+    # flatten the per-region, per-date records and add up the deaths of
+    # each age category (over all dates and regions) in one bincount
+    ages, counts = [], []
+    for payload in regional['death_Demographics']:
+        for record in payload or ():
+            ages.append(record['age'])
+            counts.append(record['deaths'])
+    # get_indexer gives -1 for age bands not in age_cat; those are skipped
+    codes = pd.Index(age_cat).get_indexer(ages)
+    known = codes >= 0
+    counts = np.nan_to_num(np.asarray(counts, dtype=np.float64))
+    totals = np.bincount(codes[known], weights=counts[known],
+                         minlength=len(age_cat))
+    deaths = pd.Series(np.rint(totals).astype(np.int64), index=age_cat)
 
     # group age categories to have only <60 old years and 60+
-    cat_1 = deaths_df.loc[deaths_df['age category'] == '00_59']
-    cat_2 = deaths_df.loc[deaths_df['age category'] == '60+']
-    below_60 = cat_1['number of deaths'].sum()
-    above_60 = cat_2['number of deaths'].sum()
-    lst1 = ['<60', '60+']
-    lst2 = [below_60, above_60]
-    final_deaths_age_cat = pd.DataFrame(list(zip(lst1, lst2)),
-                                        columns=['age category',
-                                                 'number of deaths'])
+    below_60 = deaths['00_59']
+    above_60 = deaths['60+']
+    final_deaths_age_cat = pd.DataFrame({
+        'age category': ['<60', '60+'],
+        'number of deaths': np.array([below_60, above_60], dtype=np.int64)})
     # getting highest number of deaths for each age category
 
-    # PLOTTING A BAR PLOT OF NUMBER OF DEATHS vs AGE CATEGORY
-    fig = plt.figure(figsize=(12, 10))
-
-    ax = fig.add_subplot()
-    # Plot varibles
-    ax.bar(final_deaths_age_cat['age category'],
-           final_deaths_age_cat['number of deaths'])
-    # plot(date, cum_deaths)
-
-    # Style and label plot
-    ax.set_xlabel('Age category')
-    ax.set_ylabel('Number of deaths')
-    ax.fill_between(final_deaths_age_cat['age category'],
-                    final_deaths_age_cat['number of deaths'],
-                    alpha=0.3)
-    ax.set_title('Number of deaths per age category (England)',
-                 fontsize=18)
-
-    at = AnchoredText(f"Number of deaths:\
+    # Style this figure only, leaving the global rc settings alone
+    with plt.style.context('ggplot'):
+        # PLOTTING A BAR PLOT OF NUMBER OF DEATHS vs AGE CATEGORY
+        fig, ax, own_fig = _figure_axes(ax, figsize=(12, 10))
+        # Plot varibles
+        ax.bar(final_deaths_age_cat['age category'],
+               final_deaths_age_cat['number of deaths'])
+        # plot(date, cum_deaths)
+
+        # Style and label plot
+        ax.set_xlabel('Age category')
+        ax.set_ylabel('Number of deaths')
+        ax.fill_between(final_deaths_age_cat['age category'],
+                        final_deaths_age_cat['number of deaths'],
+                        alpha=0.3)
+        ax.set_title('Number of deaths per age category (England)',
+                     fontsize=18)
+
+        at = AnchoredText(f"Number of deaths:\
                       \nAge <60: {below_60}\
                       \nAge >60: {above_60}",
-                      prop=dict(size=16), frameon=True, loc='upper left')
+                          prop=dict(size=16), frameon=True, loc='upper left')
 
-    # \nCumulative cases\n{cumulative[0]:,.0f}\
-    at.patch.set_boxstyle("round,pad=0.,rounding_size=0.2")
-    ax.add_artist(at)
-    ax.annotate('Source: gov.uk https://api.coronavirus.data.gov.uk/v1/data',
-                xy=(0.25, 0.0175), xycoords='figure fraction',
-                fontsize=12, color='#555555')
+        # \nCumulative cases\n{cumulative[0]:,.0f}\
+        at.patch.set_boxstyle("round,pad=0.,rounding_size=0.2")
+        ax.add_artist(at)
+        ax.annotate('Source: gov.uk '
+                    'https://api.coronavirus.data.gov.uk/v1/data',
+                    xy=(0.25, 0.0175), xycoords='figure fraction',
+                    fontsize=12, color='#555555')
 
-    plt.style.use('ggplot')
-    plt.show()
-    if save:
-        date = dt.now()
-        plt.savefig(f"casenumbers{date.strftime('%Y-%m-%d')}")
+        _finish_plot(fig, save, f"casenumbers{dt.date.today():%Y-%m-%d}",
+                     owned=own_fig)
+
+
+@lru_cache(maxsize=4)
+def _hosp_data(country):
+    """Fetch the data behind collect_hosp_data, once per `country`."""
+    if country == 'england':
+        hosp_data = CovidData("england").get_national_data()
+    else:
+        hosp_data = CovidData("england").get_uk_data()
+    # Dates already arrive as datetime64
+    return hosp_data.fillna(0)
 
 
 def collect_hosp_data(country='england'):
     """Collect data for hosp and vac functions.
 
+    The data is downloaded once per country for the session; call
+    `_hosp_data.cache_clear()` and `_hosp_pivots.cache_clear()` to
+    download it again.
+
     Args:
         country (str, optional): Select country data. Defaults to 'england'.
 
     Returns:
         DataFrame: data in correct format for hosp and vac functions
     """
-    if country == 'england':
-        hosp_data = CovidData("england").get_national_data()
-        hosp_data["date"] = hosp_data["date"].astype('datetime64[ns]')
-        hosp_data = hosp_data.fillna(0)
-        return hosp_data
-    else:
-        hosp_uk = CovidData("england").get_uk_data()
-        hosp_uk["date"] = hosp_uk["date"].astype('datetime64[ns]')
-        hosp_uk = hosp_uk.fillna(0)
-        return hosp_uk
+    # A shallow copy, so callers adding or replacing columns leave the
+    # cached frame untouched
+    return _hosp_data(country).copy(deep=False)
+
+
+def _draw_heatmap(pivoted, ax=None, cmap=sns.cm.rocket_r, figsize=(16, 9)):
+    """Draw a grid as a heatmap, one cell per row and column.
 
+    Uses a single pcolormesh rather than seaborn's heatmap, which works out
+    tick labels for every row and column of long grids.
 
-def hosp_cases_plot():
+    Args:
+        pivoted (DataFrame): grid to draw, first row at the top.
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
+        cmap (Colormap, optional): Defaults to seaborn's reversed rocket.
+        figsize (tuple, optional): Defaults to (16, 9).
+
+    Returns:
+        tuple: figure, axes and whether the figure was created here.
+    """
+    fig, ax, own_fig = _figure_axes(ax, figsize)
+    values = np.ma.masked_invalid(pivoted.to_numpy(dtype=np.float64))
+    mesh = ax.pcolormesh(values, cmap=cmap)
+    fig.colorbar(mesh, ax=ax)
+    # Label every cell of short axes, and every n-th one of long axes
+    for axis, labels in ((ax.xaxis, pivoted.columns),
+                         (ax.yaxis, pivoted.index)):
+        step = max(1, len(labels) // 40)
+        axis.set_ticks(np.arange(0, len(labels), step) + 0.5)
+        axis.set_ticklabels(labels[::step].astype(str))
+    ax.invert_yaxis()
+    ax.grid(False)
+    ax.set_xlabel(pivoted.columns.name or '')
+    ax.set_ylabel(pivoted.index.name or '')
+    return fig, ax, own_fig
+
+
+_HOSP_HEATMAP_COLS = ["hosp_hospitalCases", "hosp_newAdmissions"]
+
+
+@lru_cache(maxsize=4)
+def _hosp_pivots(country):
+    """Day-by-month pivots of the hospital heatmap columns for `country`.
+
+    The day and month keys are computed once and every column is pivoted
+    in the same pass; the result maps each column name to its pivot.
+    """
+    hosp_data = _hosp_data(country).loc[:, ["date"] + _HOSP_HEATMAP_COLS]
+    # Key by month as datetime64; only the pivot's rows get formatted
+    hosp_data = hosp_data.assign(
+        Day=hosp_data["date"].dt.day.astype("int8"),
+        date=hosp_data["date"].to_numpy().astype("datetime64[M]"))
+    pivot = hosp_data.pivot_table(_HOSP_HEATMAP_COLS, index="date",
+                                  columns="Day")
+    pivot.index = pivot.index.strftime("%Y-%m")
+    return {col: pivot[col] for col in _HOSP_HEATMAP_COLS}
+
+
+def hosp_cases_plot(ax=None):
     """Heatmap for the the daily number of hospital cases (England).
 
     Args:
-        No args required, collects own data.
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
     Returns :
-      Seaborn heatmap plot for the number of hospital cases
+      Heatmap plot for the number of hospital cases
       per day of the pandemic.
     """
-    hosp_data = collect_hosp_data()
-    hosp_cases_col = ["date", "hosp_hospitalCases"]
-    hosp_data1 = hosp_data.loc[:, hosp_cases_col]
-    hosp_data1.loc[:, ["Day"]] = hosp_data1["date"].apply(lambda x: x.day)
-    hosp_data1["date"] = hosp_data1.date.dt.strftime("%Y-%m")
-    newpivot = hosp_data1.pivot_table("hosp_hospitalCases", index="date",
-                                      columns="Day")
-    cmap = sns.cm.rocket_r
-    plt.figure(figsize=(16, 9))
-    hm2 = sns.heatmap(newpivot, cmap=cmap)
+    newpivot = _hosp_pivots('england')["hosp_hospitalCases"]
+    fig, hm2, own_fig = _draw_heatmap(newpivot, ax)
     hm2.set_title("Heatmap of the daily number of hospital cases (England)",
                   fontsize=14)
     hm2.set_xlabel("Day", fontsize=12)
     hm2.set_ylabel("Month and Year", fontsize=12)
+    _finish_plot(fig, False, None, owned=own_fig)
 
 
-def hosp_newadmissions_plot():
+def hosp_newadmissions_plot(ax=None):
     """Heatmap for the the daily number of new hospital admissions (England).
 
     Args:
-        No args required, collects own data.
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
     Returns :
-        Seaborn heatmap plot for the number of new hospital admissions per day
+        Heatmap plot for the number of new hospital admissions per day
         of the pandemic.
     """
-    hosp_data = collect_hosp_data()
-    hosp_cases_col = ["date", "hosp_newAdmissions"]
-    hosp_data2 = hosp_data.loc[:, hosp_cases_col]
-    hosp_data2["Day"] = hosp_data2.date.apply(lambda x: x.day)
-    hosp_data2["date"] = hosp_data2.date.dt.strftime("%Y-%m")
-    newpivot = hosp_data2.pivot_table("hosp_newAdmissions", index="date",
-                                      columns="Day")
-    cmap = sns.cm.rocket_r
-    plt.figure(figsize=(16, 9))
-    hm1 = sns.heatmap(newpivot, cmap=cmap)
+    newpivot = _hosp_pivots('england')["hosp_newAdmissions"]
+    fig, hm1, own_fig = _draw_heatmap(newpivot, ax)
     hm1.set_title("Heatmap of the daily number of new hospital admissions"
                   + " (England)", fontsize=14)
     hm1.set_xlabel("Day", fontsize=12)
     hm1.set_ylabel("Month and Year", fontsize=12)
+    _finish_plot(fig, False, None, owned=own_fig)
 
 
-def hosp_newadmissionschange_plot():
+def hosp_newadmissionschange_plot(ax=None):
     """Change in hospital admissions (England).
 
        Plot difference between the number of new hospital admissions
        during the latest 7-day period and the previous non-overlapping week.
 
     Args:
-        No args required, collects own data.
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
     Returns :
         Lineplot of this difference over the months.
     """
-    hosp_data = collect_hosp_data()
     hosp_cases_col = ["date", "hosp_newAdmissionsChange"]
-    hosp_data3 = hosp_data.loc[:, hosp_cases_col]
-    x = hosp_data3["date"].dt.strftime("%Y-%m")
-    y = hosp_data3["hosp_newAdmissionsChange"]
-    fig, ax = plt.subplots(1, 1, figsize=(20, 3))
-    sns.lineplot(x=x, y=y, color="g")
+    hosp_data3 = collect_hosp_data().loc[:, hosp_cases_col]
+    # Monthly means, as the line was previously drawn per month label
+    monthly = hosp_data3.resample("MS", on="date")
+    monthly = monthly["hosp_newAdmissionsChange"].mean()
+    fig, ax, own_fig = _figure_axes(ax, figsize=(20, 3))
+    ax.plot(monthly.index, monthly.to_numpy(), color="g")
     ax.set_title("Daily new admissions change (England)", fontsize=14)
-    ax.invert_xaxis()
     ax.set_xlabel("Date", fontsize=12)
     ax.set_ylabel("New Admissions Change", fontsize=12)
+    _finish_plot(fig, False, None, owned=own_fig)
 
 
-def hosp_occupiedbeds_plot():
+def hosp_occupiedbeds_plot(ax=None):
     """Plot daily number of COVID-19 patients in mechanical ventilator beds.
 
     Plots information for England.
 
     Args:
-        No args required, collects own data.
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
     Returns :
         - Lineplot of this difference over the months.
     """
-    hosp_data = collect_hosp_data()
     hosp_cases_col = ["date", "hosp_covidOccupiedMVBeds"]
-    hosp_data4 = hosp_data.loc[:, hosp_cases_col]
-    fig, ax = plt.subplots(1, 1, figsize=(20, 3))
-    sns.lineplot(x=hosp_data4["date"].dt.strftime("%Y-%m"),
-                 y=hosp_data4["hosp_covidOccupiedMVBeds"], ax=ax, color="b")
+    hosp_data4 = collect_hosp_data().loc[:, hosp_cases_col]
+    # Monthly means, as the line was previously drawn per month label
+    monthly = hosp_data4.resample("MS", on="date")
+    monthly = monthly["hosp_covidOccupiedMVBeds"].mean()
+    fig, ax, own_fig = _figure_axes(ax, figsize=(20, 3))
+    ax.plot(monthly.index, monthly.to_numpy(), color="b")
     ax.set_title("Daily number of COVID occupied Mechanical Ventilator beds"
                  + " (England)", fontsize=14)
-    ax.invert_xaxis()
     ax.set_xlabel("Date", fontsize=12)
     ax.set_ylabel("Number of occupied MV beds", fontsize=12)
+    _finish_plot(fig, False, None, owned=own_fig)
 
 
-def hosp_casesuk_plot():
+def hosp_casesuk_plot(ax=None):
     """Heatmap for the the daily number of hospital cases in UK.
 
     Args:
-        No args required, collects own data.
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
     Returns :
-      Seaborn heatmap plot for the number of hospital cases
+      Heatmap plot for the number of hospital cases
       per day of the pandemic.
     """
-    hosp_uk = collect_hosp_data(country='uk')
-    hosp_cases_col = ["date", "hosp_hospitalCases"]
-    hosp_data1 = hosp_uk.loc[:, hosp_cases_col]
-    hosp_data1["Day"] = hosp_data1["date"].apply(lambda x: x.day)
-    hosp_data1["date"] = hosp_data1.date.dt.strftime("%Y-%m")
-    newpivot = hosp_data1.pivot_table("hosp_hospitalCases", index="date",
-                                      columns="Day")
-    cmap = sns.cm.rocket_r
-    plt.figure(figsize=(16, 9))
-    hm2 = sns.heatmap(newpivot, cmap=cmap)
+    newpivot = _hosp_pivots('uk')["hosp_hospitalCases"]
+    fig, hm2, own_fig = _draw_heatmap(newpivot, ax)
     hm2.set_title("Heatmap of the daily number of hospital cases in the UK",
                   fontsize=14)
     hm2.set_xlabel("Day", fontsize=12)
     hm2.set_ylabel("Month and Year", fontsize=12)
+    _finish_plot(fig, False, None, owned=own_fig)
 
 
-def hosp_newadmissionsuk_plot():
+def hosp_newadmissionsuk_plot(ax=None):
     """Heatmap for the the daily number of new hospital admissions (UK).
 
     Args:
-        No args required, collects own data.
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
     Returns :
-        Seaborn heatmap plot for the number of new hospital admissions per day
+        Heatmap plot for the number of new hospital admissions per day
         of the pandemic (UK).
     """
-    hosp_uk = collect_hosp_data(country='uk')
-    hosp_cases_col = ["date", "hosp_newAdmissions"]
-    hosp_data2 = hosp_uk.loc[:, hosp_cases_col]
-    hosp_data2["Day"] = hosp_data2.date.apply(lambda x: x.day)
-    hosp_data2["date"] = hosp_data2.date.dt.strftime("%Y-%m")
-    newpivot = hosp_data2.pivot_table("hosp_newAdmissions", index="date",
-                                      columns="Day")
-    cmap = sns.cm.rocket_r
-    plt.figure(figsize=(16, 9))
-    hm1 = sns.heatmap(newpivot, cmap=cmap)
+    newpivot = _hosp_pivots('uk')["hosp_newAdmissions"]
+    fig, hm1, own_fig = _draw_heatmap(newpivot, ax)
     hm1.set_title("Heatmap of the daily number of new hospital admissions"
                   + " in the UK", fontsize=14)
     hm1.set_xlabel("Day", fontsize=12)
     hm1.set_ylabel("Month and Year", fontsize=12)
+    _finish_plot(fig, False, None, owned=own_fig)
 
 
-def hosp_occupiedbedsuk_plot():
+def hosp_occupiedbedsuk_plot(ax=None):
     """Plot daily number of COVID-19 patients in mechanical ventilator beds.
 
     Plots information for UK.
 
     Args:
-        No args required, collects own data.
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
     Returns :
         - Lineplot of this difference over the months.
     """
-    hosp_uk = collect_hosp_data(country='uk')
     hosp_cases_col = ["date", "hosp_covidOccupiedMVBeds"]
-    hosp_data4 = hosp_uk.loc[:, hosp_cases_col]
-    fig, ax = plt.subplots(1, 1, figsize=(20, 3))
-    sns.lineplot(x=hosp_data4["date"].dt.strftime("%Y-%m"),
-                 y=hosp_data4["hosp_covidOccupiedMVBeds"], ax=ax, color="b")
+    hosp_data4 = collect_hosp_data(country='uk').loc[:, hosp_cases_col]
+    # Monthly means, as the line was previously drawn per month label
+    monthly = hosp_data4.resample("MS", on="date")
+    monthly = monthly["hosp_covidOccupiedMVBeds"].mean()
+    fig, ax, own_fig = _figure_axes(ax, figsize=(20, 3))
+    ax.plot(monthly.index, monthly.to_numpy(), color="b")
     ax.set_title("Daily number of COVID occupied Mechanical Ventilator"
                  + " beds in the UK", fontsize=14)
-    ax.invert_xaxis()
     ax.set_xlabel("Date", fontsize=12)
     ax.set_ylabel("Number of occupied MV beds", fontsize=12)
+    _finish_plot(fig, False, None, owned=own_fig)
 
 
-def vaccine_percentage(df):
+def vaccine_percentage(df, ax=None):
     """Plot the percentage of the vaccinated population over time.
 
     Args:
         df (DataFrame): Requires data returned by get_uk_data
         or get_national_data methods
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
     Retuns:
         Plot of total percentage of population vaccinated
     """
     df['date'] = df['date'].astype('datetime64[ns]')
-    plt.figure(figsize=(14, 7))
-    plot1 = sns.lineplot(x='date', y='vac_total_perc', data=df)
-    plt.ylim(0, 100)
+    fig, ax, own_fig = _figure_axes(ax, figsize=(14, 7))
+    plot1 = sns.lineplot(x='date', y='vac_total_perc', data=df, ax=ax)
+    plot1.set_ylim(0, 100)
     plot1.set_xlabel("Covid pandemic, up to date", fontsize=12)
     plot1.set_ylabel("Percentage", fontsize=12)
     plot1.set_title('Percentage of the vaccinated population over time',
                     fontsize=14)
-    # print(plot1)
+    _finish_plot(fig, False, None, owned=own_fig)
 
 
-def vaccine_doses_plot(df):
+def vaccine_doses_plot(df, ax=None):
     """Pllot both the first and second doses of vaccines.
 
     Daily information.
 
     Args:
         df (DataFrame): Requires data returned by get_national_data
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
     Returns:
         Plots of first and second vaccine doses since start of pandemic
         records
     """
-    df['date'] = df['date'].astype('datetime64[ns]')
-    keep_col = ['date', 'vac_first_dose', 'vac_second_dose']
-    vaccines_melted = df[keep_col]
-    vaccines_melted = vaccines_melted.melt('date', var_name="vaccine_doses",
-                                           value_name='count')
-    plt.figure(figsize=(14, 7))
-    plot = sns.lineplot(x='date', y='count', hue='vaccine_doses',
-                        data=vaccines_melted)
-    plt.grid()
-    plt.ylim(0, 50000000)
+    date = df['date'].astype('datetime64[ns]')
+    # One line per dose column, straight from the wide frame
+    fig, plot, own_fig = _figure_axes(ax, figsize=(14, 7))
+    for dose in ['vac_first_dose', 'vac_second_dose']:
+        plot.plot(date, df[dose], label=dose)
+    plot.legend(title='vaccine_doses')
+    plot.grid()
+    plot.set_ylim(0, 50000000)
     plot.set_ylabel("count", fontsize=12)
     plot.set_xlabel("Covid pandemic, up to date", fontsize=12)
     plot.set_title('daily amount of first and second doses' +
                    ' of vaccination administered', fontsize=14)
-    # use hue = column to categorise the data
-    # print(plot)
+    _finish_plot(fig, False, None, owned=own_fig)
 
 
-def first_vaccination_hm(df):
+def _vax_daily_pivot(df, cols):
+    """Lay out daily vaccine doses as month by day grids for the heatmaps.
+
+    All the columns are pivoted together, in one pass.
+
+    Args:
+        df (DataFrame): data from get_national_data.
+        cols (list): dose columns to lay out.
+
+    Returns:
+        dict: a DataFrame per column of `cols`, indexed by 'YYYY-MM'
+        month with a column per day of the month.
+    """
+    date = df['date'].astype('datetime64[ns]')
+    days = df[cols].fillna(0).assign(
+        Day=date.dt.day.astype('int8'),
+        date=date.to_numpy().astype('datetime64[M]'))
+    wide = days.pivot_table(cols, index='date', columns='Day', fill_value=0)
+    wide.index = wide.index.strftime('%Y-%m')
+    return {col: wide[col] for col in cols}
+
+
+def _vaccination_hm(pivoted, dose, ax=None):
+    """Draw a heatmap of one dose grid from _vax_daily_pivot."""
+    fig, plot_hm, own_fig = _draw_heatmap(pivoted, ax)
+    plot_hm.set_title(f'heatmap of the {dose} vaccination dose' +
+                      ' administered daily', fontsize=14)
+    plot_hm.set_ylabel('Year and month', fontsize=12)
+    _finish_plot(fig, False, None, owned=own_fig)
+
+
+def first_vaccination_hm(df, ax=None):
     """Plot a heatmap of the first vaccine dose (daily).
 
     Args:
         df (DataFrame): Requires data returned by get_national_data
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
     Returns:
         Heatmap of first vaccine doses over time
     """
-    df['date'] = df['date'].astype('datetime64[ns]')
-    df = df.fillna(0)
-    keep_col_hm = ['date', 'vac_first_dose']
-    vaccines_hm = df.loc[:, keep_col_hm]
-    vaccines_hm["Day"] = vaccines_hm.date.apply(lambda x: x.strftime("%d"))
-    vaccines_hm.pivot_table(index="Day", columns="date",
-                            values="vac_first_dose")
-    vaccines_hm.date = vaccines_hm.date.dt.strftime('%Y-%m')
+    pivoted = _vax_daily_pivot(df, ['vac_first_dose'])['vac_first_dose']
+    _vaccination_hm(pivoted, 'first', ax)
 
-    keep_colu = ['date', 'Day', 'vac_first_dose']
-    vaccines_hm = vaccines_hm[keep_colu]
 
-    pivoted = vaccines_hm.pivot(columns='Day',
-                                index='date',
-                                values='vac_first_dose')
+def second_vaccination_hm(df, ax=None):
+    """Plot a heatmap of the second vaccine dose (daily).
 
-    pivoted = pivoted.fillna(0)
+    Args:
+        df (DataFrame): Requires data returned by get_national_data
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
+    Returns:
+        Heatmap of second vaccine doses over time
+    """
+    pivoted = _vax_daily_pivot(df, ['vac_second_dose'])['vac_second_dose']
+    _vaccination_hm(pivoted, 'second', ax)
 
-    plt.figure(figsize=(16, 9))
-    cmap = sns.cm.rocket_r
-    plot_hm1 = sns.heatmap(pivoted, cmap=cmap)
-    plot_hm1.set_title('heatmap of the first vaccination dose' +
-                       ' administered daily', fontsize=14)
-    plot_hm1.set_ylabel('Year and month', fontsize=12)
-    # print(plot_hm1)
 
+def vaccination_hms(df, axes=None):
+    """Plot the first and second vaccine dose heatmaps (daily).
 
-def second_vaccination_hm(df):
-    """Plot a heatmap of the second vaccine dose (daily).
+    Both grids are built in a single pass over the data, rather than one
+    per heatmap as with first_vaccination_hm and second_vaccination_hm.
 
     Args:
         df (DataFrame): Requires data returned by get_national_data
+        axes (tuple, optional): a pair of matplotlib axes for the first
+            and second dose heatmaps. Defaults to None, which creates a
+            new figure for each.
     Returns:
-        Heatmap of second vaccine doses over time
+        Heatmaps of first and second vaccine doses over time
     """
-    df['date'] = df['date'].astype('datetime64[ns]')
-    df = df.fillna(0)
-    keep_col_hm = ['date', 'vac_second_dose']
-    vaccines_hm = df.loc[:, keep_col_hm]
-    vaccines_hm["Day"] = vaccines_hm.date.apply(lambda x: x.strftime("%d"))
-    vaccines_hm.pivot_table(index="Day", columns="date",
-                            values="vac_second_dose")
-    vaccines_hm.date = vaccines_hm.date.dt.strftime('%Y-%m')
-    keep_colu = ['date', 'Day', 'vac_second_dose']
-    vaccines_hm = vaccines_hm[keep_colu]
-    pivoted = vaccines_hm.pivot(columns='Day',
-                                index='date',
-                                values='vac_second_dose')
-    pivoted = pivoted.fillna(0)
-    plt.figure(figsize=(16, 9))
-    cmap = sns.cm.rocket_r
-    plot_hm2 = sns.heatmap(pivoted, cmap=cmap)
-    plot_hm2.set_title('heatmap of the second vaccination dose' +
-                       ' administered daily', fontsize=14)
-    plot_hm2.set_ylabel('Year and month', fontsize=12)
-    # print(plot_hm2)
+    pivots = _vax_daily_pivot(df, ['vac_first_dose', 'vac_second_dose'])
+    first_ax, second_ax = (None, None) if axes is None else axes
+    _vaccination_hm(pivots['vac_first_dose'], 'first', first_ax)
+    _vaccination_hm(pivots['vac_second_dose'], 'second', second_ax)
 
 
-def vaccines_across_regions(vaccines2):
+def vaccines_across_regions(vaccines2, ax=None):
     """Plot graph of the vaccination uptake percentage by English regions.
 
     Args:
         vaccines2 (DataFrame): data from get_regional_data required
+        ax (Axes, optional): matplotlib axes to draw on. Defaults to
+            None, which creates a new figure.
 
     Returns:
         plot of vaccine uptake by regions in England
     """
     keep_fd = ['date', 'name', 'vac_firstDose']
-    vaccines2['date'] = vaccines2['date'].astype('datetime64[ns]')
-    vaccines_fd = vaccines2.loc[:, keep_fd]
-    vaccines_fd.fillna(0, inplace=True)
-    vaccines_fd
+    vaccines_fd = vaccines2[keep_fd].fillna(0)
+    vaccines_fd['date'] = vaccines_fd['date'].astype('datetime64[ns]')
 
-    plt.figure(figsize=(16, 9))
+    fig, ax, own_fig = _figure_axes(ax, figsize=(16, 9))
     plot_fd = sns.lineplot(x='date', y='vac_firstDose', hue='name',
-                           data=vaccines_fd)
-    plt.ylim(0, 100)
-    plt.grid()
+                           data=vaccines_fd, ax=ax)
+    plot_fd.set_ylim(0, 100)
+    plot_fd.grid()
     plot_fd.set_ylabel("percentage", fontsize=12)
     plot_fd.set_xlabel("Covid pandemic, up to date", fontsize=12)
     plot_fd.set_title('Vaccination uptake by region', fontsize=14)
-    # print(plot_fd)
+    _finish_plot(fig, False, None, owned=own_fig)
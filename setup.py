@@ -1,5 +1,5 @@
 
-from distutils.core import setup
+from setuptools import setup
 
 setup(
     name='covidatx',         # How you named your package folder (MyLib)
@@ -23,9 +23,18 @@ setup(
     install_requires=[
         'geopandas',
         'matplotlib',
+        'numpy',
         'pandas',
+        'requests',
         'seaborn'
     ],
+    # Optional: brotli-compressed responses, faster JSON decoding and
+    # shapefile reading, and the on-disk response cache behind
+    # CovidData's `cache_ttl`
+    extras_require={
+        'fast': ['brotli', 'orjson', 'pyarrow', 'pyogrio'],
+        'cache': ['requests-cache'],
+    },
     classifiers=[
         # Chose either "3 - Alpha", "4 - Beta" or "5 - Production/Stable" as the current state of your package
         'Development Status :: 3 - Alpha',